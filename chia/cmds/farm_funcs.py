@@ -1,5 +1,8 @@
+import asyncio
 from collections import defaultdict
-from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import aiohttp
@@ -21,14 +24,37 @@ from chia.util.network import is_localhost
 
 SECONDS_PER_BLOCK = (24 * 3600) / 4608
 
+# summing via map() runs the per-coin attribute walk in C instead of a
+# generator frame per coin record
+_coin_amount = attrgetter("coin.amount")
 
-async def get_harvesters(farmer_rpc_port: Optional[int]) -> Optional[Dict[str, Any]]:
+
+@lru_cache(maxsize=1)
+def _cached_config(root_path: Path, filename: str) -> Dict[str, Any]:
+    # summary() and its helpers all read the same config file, parse it once
+    return load_config(root_path, filename)
+
+
+@lru_cache(maxsize=None)
+def _puzzlehash_for_farmer_pk(farmer_public_key: str) -> bytes32:
+    # deserializing the G1 point and hashing the puzzle is the expensive part,
+    # and the same farmer key repeats across plots and harvesters
+    return create_puzzlehash_for_pk(hexstr_to_bytes(farmer_public_key))
+
+
+async def get_harvesters(
+    farmer_rpc_port: Optional[int], farmer_client: Optional[FarmerRpcClient] = None
+) -> Optional[Dict[str, Any]]:
+    owned_client = farmer_client is None
     try:
-        config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-        self_hostname = config["self_hostname"]
-        if farmer_rpc_port is None:
-            farmer_rpc_port = config["farmer"]["rpc_port"]
-        farmer_client = await FarmerRpcClient.create(self_hostname, uint16(farmer_rpc_port), DEFAULT_ROOT_PATH, config)
+        if farmer_client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if farmer_rpc_port is None:
+                farmer_rpc_port = config["farmer"]["rpc_port"]
+            farmer_client = await FarmerRpcClient.create(
+                self_hostname, uint16(farmer_rpc_port), DEFAULT_ROOT_PATH, config
+            )
         plots = await farmer_client.get_harvesters()
     except Exception as e:
         if isinstance(e, aiohttp.ClientConnectorError):
@@ -36,82 +62,131 @@ async def get_harvesters(farmer_rpc_port: Optional[int]) -> Optional[Dict[str, A
         else:
             print(f"Exception from 'harvester' {e}")
         return None
-    farmer_client.close()
-    await farmer_client.await_closed()
+    finally:
+        if owned_client and farmer_client is not None:
+            farmer_client.close()
+            await farmer_client.await_closed()
     return plots
 
 
-async def get_blockchain_state(rpc_port: Optional[int]) -> Optional[Dict[str, Any]]:
+async def get_blockchain_state(
+    rpc_port: Optional[int], client: Optional[FullNodeRpcClient] = None
+) -> Optional[Dict[str, Any]]:
     blockchain_state = None
+    owned_client = client is None
     try:
-        config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-        self_hostname = config["self_hostname"]
-        if rpc_port is None:
-            rpc_port = config["full_node"]["rpc_port"]
-        client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
+        if client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if rpc_port is None:
+                rpc_port = config["full_node"]["rpc_port"]
+            client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
         blockchain_state = await client.get_blockchain_state()
     except Exception as e:
         if isinstance(e, aiohttp.ClientConnectorError):
             print(f"Connection error. Check if full node is running at {rpc_port}")
         else:
             print(f"Exception from 'full node' {e}")
-
-    client.close()
-    await client.await_closed()
+    finally:
+        if owned_client and client is not None:
+            client.close()
+            await client.await_closed()
     return blockchain_state
 
 
-async def get_ph_balance(rpc_port: Optional[int], puzzle_hash: bytes32) -> Optional[uint64]:
+async def get_ph_balance(
+    rpc_port: Optional[int], puzzle_hash: bytes32, client: Optional[FullNodeRpcClient] = None
+) -> Optional[uint64]:
     coins = None
+    owned_client = client is None
     try:
-        config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-        self_hostname = config["self_hostname"]
-        if rpc_port is None:
-            rpc_port = config["full_node"]["rpc_port"]
-        client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
+        if client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if rpc_port is None:
+                rpc_port = config["full_node"]["rpc_port"]
+            client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
         coins = await client.get_coin_records_by_puzzle_hash(puzzle_hash, False)
     except Exception as e:
         if isinstance(e, aiohttp.ClientConnectorError):
             print(f"Connection error. Check if full node is running at {rpc_port}")
         else:
             print(f"Exception from 'full node' {e}")
-
-    client.close()
-    await client.await_closed()
-    return sum(coin.coin.amount for coin in coins)
+    finally:
+        if owned_client and client is not None:
+            client.close()
+            await client.await_closed()
+    if coins is None:
+        return None
+    return sum(map(_coin_amount, coins))
 
 
-async def get_average_block_time(rpc_port: Optional[int]) -> float:
+async def get_ph_balances(
+    rpc_port: Optional[int], puzzle_hashes: List[bytes32], client: Optional[FullNodeRpcClient] = None
+) -> Dict[bytes32, int]:
+    balances: Dict[bytes32, int] = {puzzle_hash: 0 for puzzle_hash in puzzle_hashes}
+    owned_client = client is None
     try:
-        blocks_to_compare = 500
-        config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-        self_hostname = config["self_hostname"]
-        if rpc_port is None:
-            rpc_port = config["full_node"]["rpc_port"]
-        client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
-        blockchain_state = await client.get_blockchain_state()
-        curr: Optional[BlockRecord] = blockchain_state["peak"]
-        if curr is None or curr.height < (blocks_to_compare + 100):
+        if client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if rpc_port is None:
+                rpc_port = config["full_node"]["rpc_port"]
+            client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
+        coins = await client.get_coin_records_by_puzzle_hashes(puzzle_hashes, False)
+        for coin in coins:
+            balances[coin.coin.puzzle_hash] += coin.coin.amount
+    except Exception as e:
+        if isinstance(e, aiohttp.ClientConnectorError):
+            print(f"Connection error. Check if full node is running at {rpc_port}")
+        else:
+            print(f"Exception from 'full node' {e}")
+    finally:
+        if owned_client and client is not None:
             client.close()
             await client.await_closed()
+    return balances
+
+
+async def _nearest_transaction_block(client: FullNodeRpcClient, height: int) -> Optional[BlockRecord]:
+    # Walk back from `height` to the closest transaction block, fetching a
+    # window of block records per RPC call instead of one record per call
+    window = 32
+    end = int(height)
+    while end >= 0:
+        start = max(0, end - window + 1)
+        records = await client.get_block_records(start, end + 1)
+        if len(records) == 0:
+            return None
+        for record in reversed([BlockRecord.from_json_dict(r) for r in records]):
+            if record.height == 0 or record.is_transaction_block:
+                return record
+        end = start - 1
+    return None
+
+
+async def get_average_block_time(rpc_port: Optional[int], client: Optional[FullNodeRpcClient] = None) -> float:
+    owned_client = client is None
+    try:
+        blocks_to_compare = 500
+        if client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if rpc_port is None:
+                rpc_port = config["full_node"]["rpc_port"]
+            client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
+        blockchain_state = await client.get_blockchain_state()
+        peak: Optional[BlockRecord] = blockchain_state["peak"]
+        if peak is None or peak.height < (blocks_to_compare + 100):
             return SECONDS_PER_BLOCK
-        while curr is not None and curr.height > 0 and not curr.is_transaction_block:
-            curr = await client.get_block_record(curr.prev_hash)
+        curr = await _nearest_transaction_block(client, peak.height)
         if curr is None:
-            client.close()
-            await client.await_closed()
             return SECONDS_PER_BLOCK
 
-        past_curr = await client.get_block_record_by_height(curr.height - blocks_to_compare)
-        while past_curr is not None and past_curr.height > 0 and not past_curr.is_transaction_block:
-            past_curr = await client.get_block_record(past_curr.prev_hash)
+        past_curr = await _nearest_transaction_block(client, curr.height - blocks_to_compare)
         if past_curr is None:
-            client.close()
-            await client.await_closed()
             return SECONDS_PER_BLOCK
 
-        client.close()
-        await client.await_closed()
         return (curr.timestamp - past_curr.timestamp) / (curr.height - past_curr.height)
 
     except Exception as e:
@@ -119,39 +194,51 @@ async def get_average_block_time(rpc_port: Optional[int]) -> float:
             print(f"Connection error. Check if full node is running at {rpc_port}")
         else:
             print(f"Exception from 'full node' {e}")
-
-    client.close()
-    await client.await_closed()
-    return SECONDS_PER_BLOCK
+        return SECONDS_PER_BLOCK
+    finally:
+        if owned_client and client is not None:
+            client.close()
+            await client.await_closed()
 
 
-async def get_wallets_stats(wallet_rpc_port: Optional[int]) -> Optional[Dict[str, Any]]:
+async def get_wallets_stats(
+    wallet_rpc_port: Optional[int], wallet_client: Optional[WalletRpcClient] = None
+) -> Optional[Dict[str, Any]]:
     amounts = None
+    owned_client = wallet_client is None
     try:
-        config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-        self_hostname = config["self_hostname"]
-        if wallet_rpc_port is None:
-            wallet_rpc_port = config["wallet"]["rpc_port"]
-        wallet_client = await WalletRpcClient.create(self_hostname, uint16(wallet_rpc_port), DEFAULT_ROOT_PATH, config)
+        if wallet_client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if wallet_rpc_port is None:
+                wallet_rpc_port = config["wallet"]["rpc_port"]
+            wallet_client = await WalletRpcClient.create(
+                self_hostname, uint16(wallet_rpc_port), DEFAULT_ROOT_PATH, config
+            )
         amounts = await wallet_client.get_farmed_amount()
     #
     # Don't catch any exceptions, the caller will handle it
     #
     finally:
-        wallet_client.close()
-        await wallet_client.await_closed()
+        if owned_client and wallet_client is not None:
+            wallet_client.close()
+            await wallet_client.await_closed()
 
     return amounts
 
 
-async def is_farmer_running(farmer_rpc_port: Optional[int]) -> bool:
+async def is_farmer_running(farmer_rpc_port: Optional[int], farmer_client: Optional[FarmerRpcClient] = None) -> bool:
     is_running = False
+    owned_client = farmer_client is None
     try:
-        config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-        self_hostname = config["self_hostname"]
-        if farmer_rpc_port is None:
-            farmer_rpc_port = config["farmer"]["rpc_port"]
-        farmer_client = await FarmerRpcClient.create(self_hostname, uint16(farmer_rpc_port), DEFAULT_ROOT_PATH, config)
+        if farmer_client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if farmer_rpc_port is None:
+                farmer_rpc_port = config["farmer"]["rpc_port"]
+            farmer_client = await FarmerRpcClient.create(
+                self_hostname, uint16(farmer_rpc_port), DEFAULT_ROOT_PATH, config
+            )
         await farmer_client.get_connections()
         is_running = True
     except Exception as e:
@@ -159,29 +246,37 @@ async def is_farmer_running(farmer_rpc_port: Optional[int]) -> bool:
             print(f"Connection error. Check if farmer is running at {farmer_rpc_port}")
         else:
             print(f"Exception from 'farmer' {e}")
-
-    farmer_client.close()
-    await farmer_client.await_closed()
+    finally:
+        if owned_client and farmer_client is not None:
+            farmer_client.close()
+            await farmer_client.await_closed()
     return is_running
 
 
-async def get_challenges(farmer_rpc_port: Optional[int]) -> Optional[List[Dict[str, Any]]]:
+async def get_challenges(
+    farmer_rpc_port: Optional[int], farmer_client: Optional[FarmerRpcClient] = None
+) -> Optional[List[Dict[str, Any]]]:
     signage_points = None
+    owned_client = farmer_client is None
     try:
-        config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-        self_hostname = config["self_hostname"]
-        if farmer_rpc_port is None:
-            farmer_rpc_port = config["farmer"]["rpc_port"]
-        farmer_client = await FarmerRpcClient.create(self_hostname, uint16(farmer_rpc_port), DEFAULT_ROOT_PATH, config)
+        if farmer_client is None:
+            config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+            self_hostname = config["self_hostname"]
+            if farmer_rpc_port is None:
+                farmer_rpc_port = config["farmer"]["rpc_port"]
+            farmer_client = await FarmerRpcClient.create(
+                self_hostname, uint16(farmer_rpc_port), DEFAULT_ROOT_PATH, config
+            )
         signage_points = await farmer_client.get_signage_points()
     except Exception as e:
         if isinstance(e, aiohttp.ClientConnectorError):
             print(f"Connection error. Check if farmer is running at {farmer_rpc_port}")
         else:
             print(f"Exception from 'farmer' {e}")
-
-    farmer_client.close()
-    await farmer_client.await_closed()
+    finally:
+        if owned_client and farmer_client is not None:
+            farmer_client.close()
+            await farmer_client.await_closed()
     return signage_points
 
 
@@ -209,113 +304,155 @@ async def summary(
     harvester_rpc_port: Optional[int],
     farmer_rpc_port: Optional[int],
 ) -> None:
-    config = load_config(DEFAULT_ROOT_PATH, "config.yaml")
-    all_harvesters = await get_harvesters(farmer_rpc_port)
-    blockchain_state = await get_blockchain_state(rpc_port)
-    farmer_running = await is_farmer_running(farmer_rpc_port)
-
-    wallet_not_ready: bool = False
-    wallet_not_running: bool = False
-    amounts = None
+    config = _cached_config(DEFAULT_ROOT_PATH, "config.yaml")
+    self_hostname = config["self_hostname"]
+    if rpc_port is None:
+        rpc_port = config["full_node"]["rpc_port"]
+    if wallet_rpc_port is None:
+        wallet_rpc_port = config["wallet"]["rpc_port"]
+    if farmer_rpc_port is None:
+        farmer_rpc_port = config["farmer"]["rpc_port"]
+
+    # Share one client (and thus one TLS session) per daemon across all of the
+    # RPC calls below, instead of reconnecting for every call
+    node_client: Optional[FullNodeRpcClient] = None
+    farmer_client: Optional[FarmerRpcClient] = None
+    wallet_client: Optional[WalletRpcClient] = None
     try:
-        amounts = await get_wallets_stats(wallet_rpc_port)
-    except Exception as e:
-        if isinstance(e, aiohttp.ClientConnectorError):
-            wallet_not_running = True
-        else:
-            wallet_not_ready = True
-
-    print("Farming status: ", end="")
-    if blockchain_state is None:
-        print("Not available")
-    elif blockchain_state["sync"]["sync_mode"]:
-        print("Syncing")
-    elif not blockchain_state["sync"]["synced"]:
-        print("Not synced or not connected to peers")
-    elif not farmer_running:
-        print("Not running")
-    else:
-        print("Farming")
-
-    if amounts is not None:
-        print(f"Total gold farmed: {amounts['farmed_amount'] / units['chia']}")
-        print(f"User transaction fees: {amounts['fee_amount'] / units['chia']}")
-        print(f"Block rewards: {(amounts['farmer_reward_amount'] + amounts['pool_reward_amount']) / units['chia']}")
-        print(f"Last height farmed: {amounts['last_height_farmed']}")
-
-    class PlotStats:
-        total_plot_size = 0
-        total_plots = 0
-        staking_addresses = defaultdict(int)
-
-    if all_harvesters is not None:
-        harvesters_local: dict = {}
-        harvesters_remote: dict = {}
-        for harvester in all_harvesters["harvesters"]:
-            ip = harvester["connection"]["host"]
-            if is_localhost(ip):
-                harvesters_local[harvester["connection"]["node_id"]] = harvester
+        node_client = await FullNodeRpcClient.create(self_hostname, uint16(rpc_port), DEFAULT_ROOT_PATH, config)
+        farmer_client = await FarmerRpcClient.create(self_hostname, uint16(farmer_rpc_port), DEFAULT_ROOT_PATH, config)
+        wallet_client = await WalletRpcClient.create(self_hostname, uint16(wallet_rpc_port), DEFAULT_ROOT_PATH, config)
+        # these queries hit three different daemons and are independent, run them concurrently
+        all_harvesters, blockchain_state, farmer_running, amounts = await asyncio.gather(
+            get_harvesters(farmer_rpc_port, farmer_client),
+            get_blockchain_state(rpc_port, node_client),
+            is_farmer_running(farmer_rpc_port, farmer_client),
+            get_wallets_stats(wallet_rpc_port, wallet_client),
+            return_exceptions=True,
+        )
+
+        wallet_not_ready: bool = False
+        wallet_not_running: bool = False
+        if isinstance(amounts, Exception):
+            if isinstance(amounts, aiohttp.ClientConnectorError):
+                wallet_not_running = True
             else:
-                if ip not in harvesters_remote:
-                    harvesters_remote[ip] = {}
-                harvesters_remote[ip][harvester["connection"]["node_id"]] = harvester
-
-        def process_harvesters(harvester_peers_in: dict):
-            for harvester_peer_id, plots in harvester_peers_in.items():
-                total_plot_size_harvester = sum(map(lambda x: x["file_size"], plots["plots"]))
-                PlotStats.total_plot_size += total_plot_size_harvester
-                PlotStats.total_plots += len(plots["plots"])
-                for plot in plots["plots"]:
-                    ph = create_puzzlehash_for_pk(hexstr_to_bytes(plot["farmer_public_key"]))
-                    PlotStats.staking_addresses[ph] += 1
-                print(f"   {len(plots['plots'])} plots of size: {format_bytes(total_plot_size_harvester)}")
-
-        if len(harvesters_local) > 0:
-            print(f"Local Harvester{'s' if len(harvesters_local) > 1 else ''}")
-            process_harvesters(harvesters_local)
-        for harvester_ip, harvester_peers in harvesters_remote.items():
-            print(f"Remote Harvester{'s' if len(harvester_peers) > 1 else ''} for IP: {harvester_ip}")
-            process_harvesters(harvester_peers)
-
-        print(f"Plot count for all harvesters: {PlotStats.total_plots}")
-
-        print("Total size of plots: ", end="")
-        print(format_bytes(PlotStats.total_plot_size))
-
-        print("Staking addresses:")
-        address_prefix = config["network_overrides"]["config"][config["selected_network"]]["address_prefix"]
-        for k, v in sorted(PlotStats.staking_addresses.items(), key=(lambda tup: tup[1]), reverse=True):
-            balance = await get_ph_balance(rpc_port, k)
-            balance /= Decimal(10 ** 12)
-            # query balance
-            ph = encode_puzzle_hash(k, address_prefix)
-            print(f"  {ph} (balance: {balance}, plots: {v})")
-    else:
-        print("Plot count: Unknown")
-        print("Total size of plots: Unknown")
-
-    if blockchain_state is not None:
-        print("Estimated network space: ", end="")
-        print(format_bytes(blockchain_state["space"]))
-    else:
-        print("Estimated network space: Unknown")
-
-    minutes = -1
-    if blockchain_state is not None and all_harvesters is not None:
-        proportion = PlotStats.total_plot_size / blockchain_state["space"] if blockchain_state["space"] else -1
-        minutes = int((await get_average_block_time(rpc_port) / 60) / proportion) if proportion else -1
-
-    if all_harvesters is not None and PlotStats.total_plots == 0:
-        print("Expected time to win: Never (no plots)")
-    else:
-        print("Expected time to win: " + format_minutes(minutes))
-
-    if amounts is None:
-        if wallet_not_running:
-            print(
-                "For details on farmed rewards and fees you should run 'gold start wallet' and 'gold wallet show'"
-            )
-        elif wallet_not_ready:
-            print("For details on farmed rewards and fees you should run 'gold wallet show'")
-    else:
-        print("Note: log into your key using 'gold wallet show' to see rewards for each key")
+                wallet_not_ready = True
+            amounts = None
+        # the other helpers print and swallow their own exceptions, but guard against surprises
+        if isinstance(all_harvesters, Exception):
+            all_harvesters = None
+        if isinstance(blockchain_state, Exception):
+            blockchain_state = None
+        if isinstance(farmer_running, Exception):
+            farmer_running = False
+
+        print("Farming status: ", end="")
+        if blockchain_state is None:
+            print("Not available")
+        elif blockchain_state["sync"]["sync_mode"]:
+            print("Syncing")
+        elif not blockchain_state["sync"]["synced"]:
+            print("Not synced or not connected to peers")
+        elif not farmer_running:
+            print("Not running")
+        else:
+            print("Farming")
+
+        if amounts is not None:
+            print(f"Total gold farmed: {amounts['farmed_amount'] / units['chia']}")
+            print(f"User transaction fees: {amounts['fee_amount'] / units['chia']}")
+            print(f"Block rewards: {(amounts['farmer_reward_amount'] + amounts['pool_reward_amount']) / units['chia']}")
+            print(f"Last height farmed: {amounts['last_height_farmed']}")
+
+        class PlotStats:
+            total_plot_size = 0
+            total_plots = 0
+            staking_addresses = defaultdict(int)
+
+        if all_harvesters is not None:
+            harvesters_local: dict = {}
+            harvesters_remote: dict = {}
+            # classify each unique host once, many harvesters can share an IP
+            localhost_by_ip: Dict[str, bool] = {}
+            for harvester in all_harvesters["harvesters"]:
+                ip = harvester["connection"]["host"]
+                local = localhost_by_ip.get(ip)
+                if local is None:
+                    local = is_localhost(ip)
+                    localhost_by_ip[ip] = local
+                if local:
+                    harvesters_local[harvester["connection"]["node_id"]] = harvester
+                else:
+                    if ip not in harvesters_remote:
+                        harvesters_remote[ip] = {}
+                    harvesters_remote[ip][harvester["connection"]["node_id"]] = harvester
+
+            def process_harvesters(harvester_peers_in: dict):
+                for harvester_peer_id, plots in harvester_peers_in.items():
+                    # accumulate sizes and staking addresses in a single pass over the plots
+                    total_plot_size_harvester = 0
+                    for plot in plots["plots"]:
+                        total_plot_size_harvester += plot["file_size"]
+                        PlotStats.staking_addresses[_puzzlehash_for_farmer_pk(plot["farmer_public_key"])] += 1
+                    PlotStats.total_plot_size += total_plot_size_harvester
+                    PlotStats.total_plots += len(plots["plots"])
+                    print(f"   {len(plots['plots'])} plots of size: {format_bytes(total_plot_size_harvester)}")
+
+            if len(harvesters_local) > 0:
+                print(f"Local Harvester{'s' if len(harvesters_local) > 1 else ''}")
+                process_harvesters(harvesters_local)
+            for harvester_ip, harvester_peers in harvesters_remote.items():
+                print(f"Remote Harvester{'s' if len(harvester_peers) > 1 else ''} for IP: {harvester_ip}")
+                process_harvesters(harvester_peers)
+
+            print(f"Plot count for all harvesters: {PlotStats.total_plots}")
+
+            print("Total size of plots: ", end="")
+            print(format_bytes(PlotStats.total_plot_size))
+
+            print("Staking addresses:")
+            address_prefix = config["network_overrides"]["config"][config["selected_network"]]["address_prefix"]
+            staking_addresses = sorted(PlotStats.staking_addresses.items(), key=(lambda tup: tup[1]), reverse=True)
+            # query all balances in a single RPC round trip
+            balances = await get_ph_balances(rpc_port, [k for k, _ in staking_addresses], node_client)
+            for k, v in staking_addresses:
+                balance = balances[k] / units["chia"]
+                ph = encode_puzzle_hash(k, address_prefix)
+                print(f"  {ph} (balance: {balance}, plots: {v})")
+        else:
+            print("Plot count: Unknown")
+            print("Total size of plots: Unknown")
+
+        if blockchain_state is not None:
+            print("Estimated network space: ", end="")
+            print(format_bytes(blockchain_state["space"]))
+        else:
+            print("Estimated network space: Unknown")
+
+        minutes = -1
+        if blockchain_state is not None and all_harvesters is not None:
+            proportion = PlotStats.total_plot_size / blockchain_state["space"] if blockchain_state["space"] else -1
+            minutes = int((await get_average_block_time(rpc_port, node_client) / 60) / proportion) if proportion else -1
+
+        if all_harvesters is not None and PlotStats.total_plots == 0:
+            print("Expected time to win: Never (no plots)")
+        else:
+            print("Expected time to win: " + format_minutes(minutes))
+
+        if amounts is None:
+            if wallet_not_running:
+                print(
+                    "For details on farmed rewards and fees you should run 'gold start wallet' and 'gold wallet show'"
+                )
+            elif wallet_not_ready:
+                print("For details on farmed rewards and fees you should run 'gold wallet show'")
+        else:
+            print("Note: log into your key using 'gold wallet show' to see rewards for each key")
+    finally:
+        for client in (node_client, farmer_client, wallet_client):
+            if client is not None:
+                client.close()
+        for client in (node_client, farmer_client, wallet_client):
+            if client is not None:
+                await client.await_closed()
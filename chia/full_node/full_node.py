@@ -27,7 +27,7 @@ from chia.full_node.bundle_tools import detect_potential_template_generator
 from chia.full_node.coin_store import CoinStore
 from chia.full_node.full_node_store import FullNodeStore, FullNodeStorePeakResult
 from chia.full_node.hint_store import HintStore
-from chia.full_node.lock_queue import LockClient, LockQueue
+from chia.full_node.lock_queue import InstrumentedLock, LockClient, LockQueue
 from chia.full_node.mempool_manager import MempoolManager
 from chia.full_node.signage_point import SignagePoint
 from chia.full_node.sync_store import SyncStore
@@ -88,6 +88,7 @@ class FullNode:
     initialized: bool
     weight_proof_handler: Optional[WeightProofHandler]
     _ui_tasks: Set[asyncio.Task]
+    _blockchain_lock: InstrumentedLock
     _blockchain_lock_queue: LockQueue
     _blockchain_lock_ultra_priority: LockClient
     _blockchain_lock_high_priority: LockClient
@@ -175,7 +176,8 @@ class FullNode:
 
         # Blocks are validated under high priority, and transactions under low priority. This guarantees blocks will
         # be validated first.
-        self._blockchain_lock_queue = LockQueue(self.blockchain.lock)
+        self._blockchain_lock = InstrumentedLock(self.blockchain.lock)
+        self._blockchain_lock_queue = LockQueue(self._blockchain_lock)
         self._blockchain_lock_ultra_priority = LockClient(0, self._blockchain_lock_queue)
         self._blockchain_lock_high_priority = LockClient(1, self._blockchain_lock_queue)
         self._blockchain_lock_low_priority = LockClient(2, self._blockchain_lock_queue)
@@ -713,6 +715,7 @@ class FullNode:
             self.uncompact_task.cancel()
         self._transaction_queue_task.cancel()
         self._blockchain_lock_queue.close()
+        self._blockchain_lock.log_profile()
 
     async def _await_closed(self):
         cancel_task_safe(self._sync_task, self.log)
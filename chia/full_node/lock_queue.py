@@ -1,13 +1,97 @@
 import asyncio
 import dataclasses
 import logging
+import sys
+import time
 import traceback
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Dict, Tuple, Union
 
 
 log = logging.getLogger(__name__)
 
 
+class InstrumentedLock:
+    """
+    Wraps an asyncio.Lock and records how long callers wait for the lock and
+    how long they hold it. Waits longer than 1 second and holds longer than
+    2 seconds are logged as warnings, and per-call-site totals are collected
+    in `profile`, which log_profile() dumps to the log.
+
+    Timing uses time.monotonic_ns(): it is cheaper than time.time(), returns
+    integers, and is immune to wall clock adjustments (NTP slew would
+    otherwise produce negative hold times). Durations are kept as integer
+    nanoseconds and only converted to seconds when formatted.
+    """
+
+    def __init__(self, inner_lock: asyncio.Lock):
+        self._inner_lock: asyncio.Lock = inner_lock
+        # keyed by the call site that released the lock; formatted stacks are
+        # only captured (and kept in stack_text) when a slow hold is reported
+        self.profile: Dict[str, Tuple[int, int, int]] = {}
+        self.stack_text: Dict[str, str] = {}
+        self._current_lock_time: int = 0
+        self._current_wait_time: int = 0
+
+    def locked(self) -> bool:
+        return self._inner_lock.locked()
+
+    async def acquire(self) -> bool:
+        start_wait = time.monotonic_ns()
+        await self._inner_lock.acquire()
+        self._current_lock_time = time.monotonic_ns()
+        self._current_wait_time = self._current_lock_time - start_wait
+        # No stack here: when the lock is driven by LockQueue the acquiring
+        # frame is always the queue's _run task, so a stack would only show
+        # queue plumbing. The slow-hold warning in release() identifies the
+        # holder through LockClient.__aexit__.
+        if self._current_wait_time > 1_000_000_000:
+            log.warning(f"Waited {self._current_wait_time / 1_000_000_000:0.2f}s for lock")
+        return True
+
+    @staticmethod
+    def _caller_key() -> str:
+        # Cheap profile key: the nearest frame outside this module. Unlike
+        # traceback.format_stack this does not walk the whole stack or read
+        # source lines, so it is safe to do on every release.
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        if frame is None:
+            return "<unknown>"
+        return f"{frame.f_code.co_name} ({frame.f_code.co_filename}:{frame.f_lineno})"
+
+    def release(self) -> None:
+        release_time = time.monotonic_ns()
+        hold_time = release_time - self._current_lock_time
+        key = self._caller_key()
+        if hold_time > 2_000_000_000:
+            # only pay for full stack formatting when the hold is slow enough
+            # to report, and at most once per call site
+            stack = self.stack_text.get(key)
+            if stack is None:
+                stack = "".join(traceback.format_stack(limit=15)[:-1])
+                self.stack_text[key] = stack
+            log.warning(f"Lock held for {hold_time / 1_000_000_000:0.2f}s:\n{stack}")
+        count, total_wait, total_hold = self.profile.get(key, (0, 0, 0))
+        self.profile[key] = (count + 1, total_wait + self._current_wait_time, total_hold + hold_time)
+        self._inner_lock.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def log_profile(self) -> None:
+        for key, (count, total_wait, total_hold) in sorted(
+            self.profile.items(), key=(lambda item: item[1][2]), reverse=True
+        ):
+            log.info(
+                f"{key}: lock acquired {count} times, waited {total_wait / 1_000_000_000:0.2f}s, "
+                f"held {total_hold / 1_000_000_000:0.2f}s"
+            )
+
+
 @dataclasses.dataclass(frozen=True, order=True)
 class PrioritizedCallable:
     priority: int
@@ -31,8 +115,8 @@ class LockQueue:
     Must be created under an asyncio running loop, and close and await_closed should be called.
     """
 
-    def __init__(self, inner_lock: asyncio.Lock):
-        self._inner_lock: asyncio.Lock = inner_lock
+    def __init__(self, inner_lock: Union[asyncio.Lock, InstrumentedLock]):
+        self._inner_lock: Union[asyncio.Lock, InstrumentedLock] = inner_lock
         self._task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self._run_task = asyncio.create_task(self._run())
         self._release_event = asyncio.Event()
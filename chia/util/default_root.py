@@ -1,6 +1,23 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
-DEFAULT_ROOT_PATH = Path(os.path.expanduser(os.getenv("GOLD_ROOT", "~/.gold/mainnet"))).resolve()
 
-DEFAULT_KEYS_ROOT_PATH = Path(os.path.expanduser(os.getenv("GOLD_KEYS_ROOT", "~/.gold_keys"))).resolve()
+@lru_cache(maxsize=1)
+def get_default_root_path() -> Path:
+    return Path(os.path.expanduser(os.getenv("GOLD_ROOT", "~/.gold/mainnet"))).resolve()
+
+
+@lru_cache(maxsize=1)
+def get_default_keys_root_path() -> Path:
+    return Path(os.path.expanduser(os.getenv("GOLD_KEYS_ROOT", "~/.gold_keys"))).resolve()
+
+
+def __getattr__(name: str) -> Path:
+    # PEP 562: resolve() stats the filesystem, so compute the default paths on
+    # first access instead of at import time, and only once per process
+    if name == "DEFAULT_ROOT_PATH":
+        return get_default_root_path()
+    if name == "DEFAULT_KEYS_ROOT_PATH":
+        return get_default_keys_root_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
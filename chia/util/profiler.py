@@ -27,13 +27,17 @@ async def profile_task(root_path: pathlib.Path, service: str, log: logging.Logge
 
     counter = 0
 
+    # reuse one profiler object for the lifetime of the task, clearing its
+    # stats between slots, instead of allocating a fresh one every second
+    pr = cProfile.Profile()
     while True:
-        pr = cProfile.Profile()
         pr.enable()
         # this will throw CancelledError when we're exiting
         await asyncio.sleep(1)
+        pr.disable()
         pr.create_stats()
         pr.dump_stats(profile_dir / ("slot-%05d.profile" % counter))
+        pr.clear()
         log.debug("saving profile %05d" % counter)
         counter += 1
 
@@ -41,7 +45,6 @@ async def profile_task(root_path: pathlib.Path, service: str, log: logging.Logge
 if __name__ == "__main__":
     import sys
     import pstats
-    import io
     from colorama import init, Fore, Back, Style
     from subprocess import check_call
 
@@ -52,34 +55,19 @@ if __name__ == "__main__":
         counter = 0
         try:
             while True:
-                f = io.StringIO()
-                st = pstats.Stats(str(profile_dir / ("slot-%05d.profile" % counter)), stream=f)
-                st.strip_dirs()
-                st.sort_stats(pstats.SortKey.CUMULATIVE)
-                st.print_stats()
-                f.seek(0)
-                total = 0.0
+                st = pstats.Stats(str(profile_dir / ("slot-%05d.profile" % counter)))
+                total = st.total_tt
                 sleep = 0.0
 
-                # output looks like this:
-                # ncalls  tottime  percall  cumtime  percall filename:lineno(function)
-                # 1    0.000    0.000    0.000    0.000 <function>
-                for line in f:
-
-                    if " function calls " in line and " in " in line and " seconds":
-                        # 304307 function calls (291692 primitive calls) in 1.031 seconds
-                        assert total == 0
-                        total = float(line.split()[-2])
-                        continue
-                    columns = line.split(None, 5)
-                    if len(columns) < 6 or columns[0] == "ncalls":
-                        continue
+                # st.stats maps (filename, lineno, function) to
+                # (call count, primitive call count, total time, cumulative time, callers)
+                for (filename, lineno, function), (cc, nc, tt, ct, callers) in st.stats.items():
 
                     # TODO: to support windows and MacOS, extend this to a list of function known to sleep the process
                     # e.g. WaitForMultipleObjects or kqueue
-                    if "{method 'poll' of 'select.epoll' objects}" in columns[5]:
+                    if "method 'poll' of 'select.epoll' objects" in function:
                         # cumulative time
-                        sleep += float(columns[3])
+                        sleep += ct
 
                 if sleep < 0.000001:
                     percent = 100.0
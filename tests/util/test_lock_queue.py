@@ -5,7 +5,7 @@ from asyncio import CancelledError
 
 import pytest
 
-from chia.full_node.lock_queue import LockQueue, LockClient
+from chia.full_node.lock_queue import InstrumentedLock, LockQueue, LockClient
 
 log = logging.getLogger(__name__)
 
@@ -79,3 +79,24 @@ class TestLockQueue:
         assert winner == "h"
 
         queue.close()
+
+    @pytest.mark.asyncio
+    async def test_instrumented_lock(self):
+        lock = InstrumentedLock(asyncio.Lock())
+
+        queue = LockQueue(lock)
+        client = LockClient(0, queue)
+
+        for i in range(3):
+            async with client:
+                await asyncio.sleep(0.01)
+
+        # all acquires come from the same call site, so one profile entry
+        assert len(lock.profile) == 1
+        ((count, total_wait, total_hold),) = lock.profile.values()
+        assert count == 3
+        assert total_wait >= 0
+        assert total_hold > 0
+        assert not lock.locked()
+
+        queue.close()